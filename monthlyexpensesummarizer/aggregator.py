@@ -1,4 +1,5 @@
 import logging
+from collections import defaultdict
 from typing import List, Dict
 
 from monthlyexpensesummarizer.config import ItemType
@@ -9,35 +10,42 @@ LOG = logging.getLogger(__name__)
 class Aggregator:
     def __init__(self):
         self.by_payment_method: Dict[str, int] = {}
-        self.by_payment_method_stringified: Dict[str, str] = {}
-        self.by_day: Dict[str, int] = {}
-        self.by_transaction_type: Dict[ItemType, int] = {}
+        self.by_payment_method_stringified: Dict[str, List[int]] = {}
+        # Running total and individual amounts per payment method, kept together so each row hashes the key once
+        self._payment_method_entries: Dict[str, list] = defaultdict(lambda: [0, []])
+        self.by_day: Dict[str, int] = defaultdict(int)
+        self.by_transaction_type: Dict[ItemType, int] = defaultdict(int)
 
     def aggregate(self, parsed_expenses: List[ParsedExpense]):
-        for expense in parsed_expenses:
-            key = expense.date
-            if key not in self.by_day:
-                self.by_day[key] = 0
-            self.by_day[key] += expense.amount
+        by_day = self.by_day
+        payment_method_entries = self._payment_method_entries
+        by_transaction_type = self.by_transaction_type
+        expense_type = ItemType.EXPENSE
 
+        for expense in parsed_expenses:
+            amount = expense.amount
             item_type = expense.item_type
-            if item_type == ItemType.EXPENSE:
-                key = expense.payment_method.display_name
-                if key not in self.by_payment_method:
-                    self.by_payment_method[key] = 0
-                    self.by_payment_method_stringified[key] = ""
-                self.by_payment_method[key] += expense.amount
-                self.by_payment_method_stringified[key] += f"{expense.amount}+"
-
-            key = item_type
-            if key not in self.by_transaction_type:
-                self.by_transaction_type[key] = 0
-            self.by_transaction_type[key] += expense.amount
+            by_day[expense.date] += amount
+
+            if item_type is expense_type:
+                entry = payment_method_entries[expense.payment_method.display_name]
+                entry[0] += amount
+                entry[1].append(amount)
+
+            by_transaction_type[item_type] += amount
+
+        self.by_payment_method = {pm: total for pm, (total, _) in payment_method_entries.items()}
+        self.by_payment_method_stringified = {pm: amounts for pm, (_, amounts) in payment_method_entries.items()}
+
+        if LOG.isEnabledFor(logging.INFO):
+            self._log_aggregates()
 
+    def _log_aggregates(self):
         LOG.info("Listing aggregates...")
         for payment_method, amount in self.by_payment_method.items():
             LOG.info("Aggregate expenses for payment method '%s': %d", payment_method, amount)
-            LOG.info("Stringified aggregate expenses for payment method '%s': %s", payment_method, self.by_payment_method_stringified[payment_method])
+            LOG.info("Stringified aggregate expenses for payment method '%s': %s", payment_method,
+                     "+".join(map(str, self.by_payment_method_stringified[payment_method])))
         for day, amount in self.by_day.items():
             LOG.info("Aggregate expenses for day '%s': %d", day, amount)
         for tx_type, amount in self.by_transaction_type.items():
@@ -2,11 +2,12 @@ import logging
 import re
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Pattern, Tuple, Union
+from typing import List, Dict, Pattern, Tuple, Union, FrozenSet
 
 from dataclasses_json import dataclass_json, LetterCase
 
 LOG = logging.getLogger(__name__)
+POSTFIX_SANITIZE_REGEX = re.compile("[a-zA-Z0-9 ]+")
 
 
 class ItemType(Enum):
@@ -16,7 +17,7 @@ class ItemType(Enum):
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class PaymentMethod:
     short_name: str
     display_name: str
@@ -26,14 +27,14 @@ class PaymentMethod:
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class IncomeSettings:
     symbol: str
     requires_postfix: bool
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class ParserSettings:
     income_settings: IncomeSettings
     more_details_spans_to_multiple_lines: bool
@@ -46,7 +47,7 @@ class ParserSettings:
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class ExpenseCategory:
     display_name: str
     primary_value: str
@@ -62,25 +63,37 @@ class ParserConfig:
     expense_categories: Dict[str, ExpenseCategory] = field(default_factory=dict)
     date_regexes: List[Pattern] = field(default_factory=list)
     payment_methods_by_prefix_and_postfix: Dict[Tuple[str, Union[str, None]], PaymentMethod] = field(default_factory=dict)
+    item_types_by_prefix: Dict[str, ItemType] = field(default_factory=dict)
+    multi_line_open_chars: FrozenSet[str] = field(default_factory=frozenset)
+    multi_line_close_chars: FrozenSet[str] = field(default_factory=frozenset)
 
     def __post_init__(self):
         for name, pm in self.payment_methods.items():
             pm.name = name
         for name, ec in self.expense_categories.items():
             ec.name = name
+        mandatory_postfix_pm_names = set(self.parser_settings.mandatory_postfix_for_payment_methods)
         for pm_key, pm in self.payment_methods.items():
             for postfix in pm.postfix_symbols:
-                found_values = re.findall("[a-zA-Z0-9 ]+", postfix)
-                if not found_values:
+                match = POSTFIX_SANITIZE_REGEX.search(postfix)
+                if not match:
                     raise ValueError("Postfix is invalid, it should only contain alphanumeric characters and space. Current postfix: {}".format(postfix))
-                sanitized_postfix = found_values[0]
+                sanitized_postfix = match.group(0)
                 key = (pm.prefix_symbol, sanitized_postfix)
                 if key in self.payment_methods_by_prefix_and_postfix:
                     payment_methods_with_dupe_key = [self.payment_methods_by_prefix_and_postfix[key], pm]
                     raise ValueError("Duplicate prefix+postfix key found: {}. Payment methods associated with this key: {}".format(key, payment_methods_with_dupe_key))
                 self.payment_methods_by_prefix_and_postfix[key] = pm
-            if pm_key not in self.parser_settings.mandatory_postfix_for_payment_methods:
+            if pm_key not in mandatory_postfix_pm_names:
                 key = (pm.prefix_symbol, None)
                 self.payment_methods_by_prefix_and_postfix[key] = pm
 
+        # Income is checked before special items when classifying an expense, so it takes precedence here
+        for prefix in self.parser_settings.special_item_prefixes:
+            self.item_types_by_prefix[prefix] = ItemType.SPECIAL
+        self.item_types_by_prefix[self.parser_settings.income_settings.symbol] = ItemType.INCOME
+
+        self.multi_line_open_chars = frozenset(self.parser_settings.expense_more_details_separator_strings)
+        self.multi_line_close_chars = frozenset(self.parser_settings.expense_more_details_close_strings)
+
         LOG.info("Initialized parser config")
@@ -58,18 +58,8 @@ class MonthlyExpenseSummarizer:
         return ProjectUtils.get_output_basedir(MONTHLY_EXPENSE_SUMMARIZER_MODULE_NAME)
 
     def start(self):
-        config_samples_dir = SimpleProjectUtils.get_project_dir(
-            basedir=LocalDirs.REPO_ROOT_DIR,
-            dir_to_find="parser_config",
-            find_result_type=FindResultType.DIRS,
-            parent_dir=REPO_ROOT_DIRNAME
-        )
-        input_files_dir = SimpleProjectUtils.get_project_dir(
-            basedir=LocalDirs.REPO_ROOT_DIR,
-            dir_to_find="expense_files",
-            find_result_type=FindResultType.DIRS,
-            parent_dir=REPO_ROOT_DIRNAME
-        )
+        config_samples_dir = MonthlyExpenseSummarizer._find_project_dir("parser_config")
+        input_files_dir = MonthlyExpenseSummarizer._find_project_dir("expense_files")
         sample_project_filename = os.path.join(config_samples_dir, "parserconfig.json")
         input_filename = os.path.join(input_files_dir, "expenses-202108")
         config_reader: ParserConfigReader = ParserConfigReader.read_from_file(filename=sample_project_filename,
@@ -77,17 +67,27 @@ class MonthlyExpenseSummarizer:
                                                                               config_type=GenericBlockParserConfig)
         MonthlyExpenseSummarizer._validate_mandatory_postfix_payment_methods(config_reader)
 
-        LOG.info("Read project config: %s", pformat(config_reader.config))
+        if LOG.isEnabledFor(logging.INFO):
+            LOG.info("Read project config: %s", pformat(config_reader.config))
         parser = ExpenseInputFileParser(config_reader)
         parsed_expenses = parser.parse(input_filename)
         aggregator = Aggregator()
         aggregator.aggregate(parsed_expenses)
 
+    @staticmethod
+    def _find_project_dir(dir_to_find: str) -> str:
+        return SimpleProjectUtils.get_project_dir(
+            basedir=LocalDirs.REPO_ROOT_DIR,
+            dir_to_find=dir_to_find,
+            find_result_type=FindResultType.DIRS,
+            parent_dir=REPO_ROOT_DIRNAME
+        )
+
     @staticmethod
     def _validate_mandatory_postfix_payment_methods(config_reader: ParserConfigReader):
-        found_mandatory_pm_names = set([pm_name for pm_name in config_reader.extended_config.parser_settings.mandatory_postfix_for_payment_methods])
-        available_payment_methods = set(config_reader.extended_config.payment_methods)
-        diff = found_mandatory_pm_names.difference(available_payment_methods)
+        found_mandatory_pm_names = set(config_reader.extended_config.parser_settings.mandatory_postfix_for_payment_methods)
+        available_payment_methods = config_reader.extended_config.payment_methods.keys()
+        diff = found_mandatory_pm_names - available_payment_methods
         if diff:
             raise ValueError("Found invalid payment method names specified in 'mandatoryPostfixForPaymentMethods': {}".format(diff))
 
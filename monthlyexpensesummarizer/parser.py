@@ -1,4 +1,5 @@
 import logging
+import re
 from dataclasses import dataclass
 
 from pythoncommons.file_parser.input_file_parser import GenericBlockBasedInputFileParser, DiagnosticConfig
@@ -10,7 +11,7 @@ LOG = logging.getLogger(__name__)
 
 
 # TODO Rename to ParsedItem?
-@dataclass
+@dataclass(slots=True)
 class ParsedExpense:
     date: str
     payment_method_marker: str
@@ -24,37 +25,34 @@ class ParsedExpense:
     item_type: ItemType = None
 
     def post_init(self, config: ParserConfig):
-        payment_method_key = (self.payment_method_marker, self.payment_method_postfix)
-
-        found_unrecognized_payment_method = False
-        if self.payment_method_marker == config.parser_settings.income_settings.symbol:
-            self.item_type = ItemType.INCOME
-        elif self.payment_method_marker in config.parser_settings.special_item_prefixes:
-            self.item_type = ItemType.SPECIAL
-        elif payment_method_key not in config.payment_methods_by_prefix_and_postfix:
-            found_unrecognized_payment_method = True
-            LOG.error("Unrecognized payment method for expense: %s", self)
-            self.payment_method = None
-            self.item_type = ItemType.EXPENSE
-        else:
-            self.payment_method = config.payment_methods_by_prefix_and_postfix[payment_method_key]
-            self.item_type = ItemType.EXPENSE
-
-        if config.parser_settings.fail_on_unrecognized_payments and found_unrecognized_payment_method:
-            raise ValueError("Found unrecognized payment methods, stopping execution as per config setting!")
+        self.item_type = config.item_types_by_prefix.get(self.payment_method_marker, ItemType.EXPENSE)
+        if self.item_type is ItemType.EXPENSE:
+            payment_method_key = (self.payment_method_marker, self.payment_method_postfix)
+            self.payment_method = config.payment_methods_by_prefix_and_postfix.get(payment_method_key)
+            if self.payment_method is None:
+                LOG.error("Unrecognized payment method for expense: %s", self)
+                if config.parser_settings.fail_on_unrecognized_payments:
+                    raise ValueError("Found unrecognized payment methods, stopping execution as per config setting!")
 
 
 class ExpenseInputFileParser:
     def __init__(self, config_reader: ParserConfigReader):
-        diagnostic_config = DiagnosticConfig(print_date_lines=True,
-                                             print_multi_line_block_headers=True,
-                                             print_multi_line_blocks=True)
+        # Diagnostics are logged at DEBUG level by the generic parser, don't produce them if they would be dropped anyway
+        diagnostics_enabled = logging.getLogger(GenericBlockBasedInputFileParser.__module__).isEnabledFor(logging.DEBUG)
+        diagnostic_config = DiagnosticConfig(print_date_lines=diagnostics_enabled,
+                                             print_multi_line_block_headers=diagnostics_enabled,
+                                             print_multi_line_blocks=diagnostics_enabled,
+                                             print_parsed_objects=diagnostics_enabled,
+                                             print_single_line_blocks=diagnostics_enabled)
 
         self.generic_parser_config: GenericBlockParserConfig = config_reader.config
         self.extended_config: ParserConfig = config_reader.extended_config
-        multi_line_expense_open_chars = ExpenseInputFileParser._get_multiline_expense_open_chars(self.extended_config)
-        multi_line_expense_close_chars = ExpenseInputFileParser._get_multiline_expense_close_chars(self.extended_config)
-        excluded_line_patterns = self.generic_parser_config.date_regexes
+        self.mandatory_fields = tuple(self.generic_parser_config.generic_parser_settings.parsed_block_format.mandatory_fields)
+        self.parsed_expense_field_names = tuple(f.lower() for f in self.mandatory_fields)
+        self.thousands_separator_table = str.maketrans("", "", "".join(self.extended_config.parser_settings.thousands_separator_chars))
+        multi_line_expense_open_chars = self.extended_config.multi_line_open_chars
+        multi_line_expense_close_chars = self.extended_config.multi_line_close_chars
+        excluded_line_patterns = ExpenseInputFileParser._get_excluded_line_patterns(self.generic_parser_config)
         self.generic_block_parser = GenericBlockBasedInputFileParser(block_regex=RegexGenerator.create_final_regex(self.generic_parser_config),
                                                                      block_open_chars=multi_line_expense_open_chars,
                                                                      block_close_chars=multi_line_expense_close_chars,
@@ -67,32 +65,23 @@ class ExpenseInputFileParser:
                                                block_to_obj_parser_func=self._parse_expense_obj_from_match_groups)
 
     @staticmethod
-    def _get_multiline_expense_open_chars(config):
-        results_list = [config.parser_settings.expense_more_details_separator_strings]
-        chars = set().union(*results_list)
-        return chars
-
-    @staticmethod
-    def _get_multiline_expense_close_chars(config):
-        results_list = [config.parser_settings.expense_more_details_close_strings]
-        chars = set().union(*results_list)
-        return chars
+    def _get_excluded_line_patterns(config):
+        # Fuse the date regexes into one alternation so each line is matched once instead of once per date format
+        date_regexes = config.date_regexes
+        if len(date_regexes) < 2:
+            return date_regexes
+        return [re.compile("|".join(f"(?:{regex.pattern})" for regex in date_regexes))]
 
     def _parse_expense_obj_from_match_groups(self, match, date: str):
         # https://stackoverflow.com/a/587518/1106893
-        prop_dict = {"date": date}
-        for mandatory_field in self.generic_parser_config.generic_parser_settings.parsed_block_format.mandatory_fields:
-            prop_dict[mandatory_field.lower()] = match.group(mandatory_field)
-            # TODO convert amount with self._convert_amount_str(amount)
+        # Match.group with several names returns all values in a single call
+        prop_dict = dict(zip(self.parsed_expense_field_names, match.group(*self.mandatory_fields)))
+        prop_dict["date"] = date
+        # TODO convert amount with self._convert_amount_str(amount)
         parsed_expense = ParsedExpense(**prop_dict)
         parsed_expense.post_init(self.extended_config)
         return parsed_expense
 
     def _convert_amount_str(self, amount: str) -> int:
-        new_amount = amount
-        sep_chars = self.extended_config.parser_settings.thousands_separator_chars
-        for sep in sep_chars:
-            if sep in amount:
-                new_amount = new_amount.replace(sep, "")
-        return int(new_amount)
+        return int(amount.translate(self.thousands_separator_table))
 
@@ -20,6 +20,7 @@ setup(
     author_email='szilard.nemeth88@gmail.com',
     url='',
     license=license,
+    python_requires='>=3.10',
     packages=find_packages(exclude=('tests', 'docs'))
 )
 